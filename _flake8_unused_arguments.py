@@ -0,0 +1,260 @@
+"""The tree walking and classification behind the plugin.
+
+These live apart from Plugin so they can be compiled with mypyc, while Plugin
+stays a regular Python class that flake8 can inspect.
+"""
+
+import ast
+from ast import Store
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+FunctionTypes = Union[ast.AsyncFunctionDef, ast.FunctionDef, ast.Lambda]
+FUNCTION_TYPES = (ast.AsyncFunctionDef, ast.FunctionDef, ast.Lambda)
+
+# bit flags returned by classify_decorators
+ABSTRACTMETHOD = 1
+OVERLOAD = 2
+OVERRIDE = 4
+CLASSMETHOD = 8
+
+_DECORATOR_FLAGS = {
+    "abstractmethod": ABSTRACTMETHOD,
+    "overload": OVERLOAD,
+    "override": OVERRIDE,
+    "classmethod": CLASSMETHOD,
+}
+
+
+def get_unused_arguments(function: FunctionTypes) -> List[Tuple[int, ast.arg]]:
+    """Get all of the unused arguments in the given function."""
+    arguments = get_arguments(function)
+    if not arguments:
+        return []
+
+    # reuse the plugin's FunctionFinder walk rather than a separate one, so that
+    # there's a single definition of which names a function uses; this gives up
+    # stopping early once every argument is seen, but nothing hot calls this
+    finder = FunctionFinder(only_top_level=True)
+    finder.visit(function)
+    used_names = finder.used_names[function]
+
+    return [
+        (arg_index, arg)
+        for arg_index, arg in enumerate(arguments)
+        if arg.arg not in used_names
+    ]
+
+
+def get_arguments(function: FunctionTypes) -> Tuple[ast.arg, ...]:
+    """Get all of the argument names of the given function, caching them on the node."""
+    ordered_arguments: Optional[Tuple[ast.arg, ...]] = getattr(
+        function, "_unused_arguments_arguments", None
+    )
+    if ordered_arguments is None:
+        args = function.args
+        ordered_arguments = (
+            # plain old args
+            *args.args,
+            # *arg name
+            *((args.vararg,) if args.vararg is not None else ()),
+            # *, key, word, only, args
+            *args.kwonlyargs,
+            # **kwarg name
+            *((args.kwarg,) if args.kwarg is not None else ()),
+        )
+        setattr(function, "_unused_arguments_arguments", ordered_arguments)
+    return ordered_arguments
+
+
+def _get_call_decorator_name(decorator: ast.Call) -> str:
+    if isinstance(decorator.func, ast.Name):
+        return decorator.func.id
+    return decorator.func.attr  # type: ignore
+
+
+_DECORATOR_NAME_GETTERS: Dict[type, Callable[[Any], str]] = {
+    ast.Name: lambda decorator: decorator.id,
+    ast.Attribute: lambda decorator: decorator.attr,
+    ast.Call: _get_call_decorator_name,
+}
+
+
+def get_decorator_names(function: FunctionTypes) -> Iterable[str]:
+    """Yield the name of each decorator on the given function.
+
+    Decorators that aren't a plain name, attribute or call (e.g. subscripts,
+    allowed since Python 3.9) have no meaningful name and are skipped.
+    """
+    if isinstance(function, ast.Lambda):
+        return
+
+    for decorator in function.decorator_list:
+        get_name = _DECORATOR_NAME_GETTERS.get(type(decorator))
+        if get_name is not None:
+            yield get_name(decorator)
+
+
+def classify_decorators(function: FunctionTypes) -> int:
+    """Get a bitmask of the interesting decorators applied to the given function.
+
+    The result is cached on the node, so repeated calls are cheap.
+    """
+    flags: Optional[int] = getattr(function, "_unused_arguments_decorators", None)
+    if flags is None:
+        flags = 0
+        for decorator_name in get_decorator_names(function):
+            flags |= _DECORATOR_FLAGS.get(decorator_name, 0)
+        setattr(function, "_unused_arguments_decorators", flags)
+    return flags
+
+
+def is_stub_function(function: FunctionTypes) -> bool:
+    """Check whether the given function is a stub, caching the result on the node."""
+    is_stub: Optional[bool] = getattr(function, "_unused_arguments_is_stub", None)
+    if is_stub is None:
+        is_stub = _is_stub_function(function)
+        setattr(function, "_unused_arguments_is_stub", is_stub)
+    return is_stub
+
+
+def _is_stub_function(function: FunctionTypes) -> bool:
+    if isinstance(function, ast.Lambda):
+        return isinstance(function.body, ast.Constant) and function.body.value is ...
+
+    body = function.body
+    if len(body) > 2:
+        # a stub is at most a docstring and one other statement
+        return False
+
+    statement = body[0]
+    if (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Constant)
+        and isinstance(statement.value.value, str)
+    ):
+        if len(body) > 1:
+            # first statement is a docstring, let's skip it
+            statement = body[1]
+        else:
+            # it's a function with only a docstring, that's a stub
+            return True
+    elif len(body) > 1:
+        return False
+
+    if isinstance(statement, ast.Pass):
+        return True
+    if (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Constant)
+        and statement.value.value is ...
+    ):
+        return True
+
+    if isinstance(statement, ast.Raise):
+        # raise NotImplementedError()
+        if (
+            isinstance(statement.exc, ast.Call)
+            and hasattr(statement.exc.func, "id")
+            and statement.exc.func.id == "NotImplementedError"
+        ):
+            return True
+
+        # raise NotImplementedError
+        elif (
+            isinstance(statement.exc, ast.Name)
+            and hasattr(statement.exc, "id")
+            and statement.exc.id == "NotImplementedError"
+        ):
+            return True
+
+    return False
+
+
+def is_dunder_method(function: FunctionTypes) -> bool:
+    if isinstance(function, ast.Lambda):
+        return False
+
+    name = function.name
+    return len(name) > 4 and name.startswith("__") and name.endswith("__")
+
+
+class FunctionFinder:
+    """Find every function in a tree, and the names each of them reads.
+
+    Names are collected during the same walk that finds the functions, so each
+    node is only visited once. A name read inside a nested function counts as
+    used by every enclosing function too, since closures can reference them;
+    rather than adding each name to every enclosing function as it's read, a
+    function's names are merged into its parent's once it has been walked.
+
+    The tree is walked with an explicit stack rather than recursively, to avoid
+    a Python call per node.
+    """
+
+    functions: List[FunctionTypes]
+    used_names: Dict[FunctionTypes, Set[str]]
+
+    def __init__(self, only_top_level: bool = False) -> None:
+        self.functions = []
+        self.used_names = {}
+        self.only_top_level = only_top_level
+
+    def visit(self, node: ast.AST) -> None:
+        # the names read by each function currently being walked, innermost last
+        frames: List[Set[str]] = []
+
+        # each entry is a node to walk, along with whether functions found in it
+        # are collected; an entry of None instead marks the end of a function
+        stack: List[Tuple[ast.AST, Optional[bool]]] = [(node, True)]
+
+        while stack:
+            node, collecting = stack.pop()
+
+            if collecting is None:
+                # everything within this function has now been walked
+                used = frames.pop()
+                self.used_names[cast(FunctionTypes, node)] = used
+                if frames:
+                    frames[-1].update(used)
+
+            elif isinstance(node, ast.Name):
+                if frames and not isinstance(node.ctx, Store):
+                    frames[-1].add(node.id)
+
+            else:
+                is_function = isinstance(node, FUNCTION_TYPES)
+                if is_function and collecting:
+                    self.functions.append(cast(FunctionTypes, node))
+                    frames.append(set())
+                    stack.append((node, None))
+
+                # push the children in reverse, so that functions are found in
+                # source order
+                for field in reversed(node._fields):
+                    value = getattr(node, field, None)
+
+                    child_collecting = collecting
+                    if is_function:
+                        # only functions within the body are collected, not those
+                        # in decorators, default values or annotations
+                        child_collecting = (
+                            collecting and field == "body" and not self.only_top_level
+                        )
+
+                    if isinstance(value, list):
+                        for item in reversed(value):
+                            if isinstance(item, ast.AST):
+                                stack.append((item, child_collecting))
+                    elif isinstance(value, ast.AST):
+                        stack.append((value, child_collecting))
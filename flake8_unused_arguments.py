@@ -1,17 +1,67 @@
 import ast
 import optparse
-from ast import NodeVisitor, Store
-from typing import Iterable, List, Tuple, Union
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Iterable, List, Optional, Set, Tuple
 
 import flake8.options.manager
 
-FunctionTypes = Union[ast.AsyncFunctionDef, ast.FunctionDef, ast.Lambda]
+# the helpers are kept in a separate module so that it can be compiled with
+# mypyc; Plugin must stay a regular Python class for flake8 to inspect it
+from _flake8_unused_arguments import (
+    ABSTRACTMETHOD,
+    CLASSMETHOD,
+    OVERLOAD,
+    OVERRIDE,
+    FunctionFinder,
+    FunctionTypes,
+    classify_decorators,
+    get_arguments,
+    get_decorator_names,
+    get_unused_arguments,
+    is_dunder_method,
+    is_stub_function,
+)
+
+__all__ = [
+    "ABSTRACTMETHOD",
+    "CHECK",
+    "CLASSMETHOD",
+    "OVERLOAD",
+    "OVERRIDE",
+    "PARALLEL_MAX_WORKERS",
+    "PARALLEL_THRESHOLD",
+    "UNUSED_ARGUMENT",
+    "UNUSED_UNDERSCORE_ARGUMENT",
+    "FunctionFinder",
+    "FunctionTypes",
+    "LintResult",
+    "Plugin",
+    "classify_decorators",
+    "get_arguments",
+    "get_decorator_names",
+    "get_unused_arguments",
+    "is_dunder_method",
+    "is_stub_function",
+]
+
 LintResult = Tuple[int, int, str, str]
 
+UNUSED_ARGUMENT = "U100"
+UNUSED_UNDERSCORE_ARGUMENT = "U101"
+CHECK = "unused argument"
+
+# minimum number of functions in a file before they're checked in parallel
+PARALLEL_THRESHOLD = 64
+
+# flake8 already runs a process per core with --jobs, so keep the number of
+# threads each of those starts small
+PARALLEL_MAX_WORKERS = 4
+
 
 class Plugin:
-    name = "flake8-unused-arguments"
-    version = "0.0.13"
+    name: ClassVar[str] = "flake8-unused-arguments"
+    version: ClassVar[str] = "0.0.13"
 
     ignore_abstract = False
     ignore_overload = False
@@ -117,196 +167,100 @@ class Plugin:
         cls.ignore_dunder_methods = options.unused_arguments_ignore_dunder_methods
 
     def run(self) -> Iterable[LintResult]:
+        yield from self._collect()
+
+    def _collect(self) -> List[LintResult]:
+        """Get every warning for the tree as a list, rather than yielding them."""
         finder = FunctionFinder(self.ignore_nested_functions)
         finder.visit(self.tree)
 
-        for function in finder.functions:
-            decorator_names = set(get_decorator_names(function))
-
-            # ignore overload functions, it's not a surprise when they're empty
-            if self.ignore_overload and "overload" in decorator_names:
-                continue
-
-            # ignore overridden functions
-            if self.ignore_override and "override" in decorator_names:
-                continue
-
-            # ignore abstractmethods, it's not a surprise when they're empty
-            if self.ignore_abstract and "abstractmethod" in decorator_names:
-                continue
+        functions = finder.functions
+        used_names = [finder.used_names[function] for function in functions]
 
-            # ignore stub functions
-            if self.ignore_stubs and is_stub_function(function):
-                continue
-
-            # ignore lambdas
-            if self.ignore_lambdas and isinstance(function, ast.Lambda):
+        # functions are checked independently, so large files can optionally be
+        # spread across threads; mostly useful on free-threaded builds of Python
+        function_results: Iterable[List[LintResult]]
+        if (
+            len(functions) > PARALLEL_THRESHOLD
+            and os.environ.get("FLAKE8_UNUSED_ARGUMENTS_PARALLEL") == "1"
+        ):
+            max_workers = min(PARALLEL_MAX_WORKERS, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                function_results = list(
+                    executor.map(self._check_function, functions, used_names)
+                )
+        else:
+            function_results = map(self._check_function, functions, used_names)
+
+        results: List[LintResult] = []
+        for function_result in function_results:
+            results.extend(function_result)
+        return results
+
+    def _check_function(
+        self, function: FunctionTypes, used_names: Set[str]
+    ) -> List[LintResult]:
+        """Get the warnings for a single function."""
+        arguments = get_arguments(function)
+
+        # nothing to report, so skip the other checks
+        if not arguments:
+            return []
+
+        decorators = classify_decorators(function)
+
+        # ignore overload functions, it's not a surprise when they're empty
+        if self.ignore_overload and decorators & OVERLOAD:
+            return []
+
+        # ignore overridden functions
+        if self.ignore_override and decorators & OVERRIDE:
+            return []
+
+        # ignore abstractmethods, it's not a surprise when they're empty
+        if self.ignore_abstract and decorators & ABSTRACTMETHOD:
+            return []
+
+        # ignore stub functions
+        if self.ignore_stubs and is_stub_function(function):
+            return []
+
+        # ignore lambdas
+        if self.ignore_lambdas and isinstance(function, ast.Lambda):
+            return []
+
+        # ignore __double_underscore_methods__()
+        if self.ignore_dunder_methods and is_dunder_method(function):
+            return []
+
+        results: List[LintResult] = []
+        add_result = results.append
+
+        is_classmethod = bool(decorators & CLASSMETHOD)
+        # compared by identity, since the *args and **kwargs nodes are the
+        # same objects that appear in the argument list
+        ignored_arguments: Tuple[Optional[ast.arg], ...] = ()
+        if self.ignore_variadic_names:
+            ignored_arguments = (function.args.vararg, function.args.kwarg)
+
+        for i, argument in enumerate(arguments):
+            name = argument.arg
+            if name in used_names or argument in ignored_arguments:
                 continue
 
-            # ignore __double_underscore_methods__()
-            if self.ignore_dunder_methods and is_dunder_method(function):
+            # ignore self or whatever the first argument is for a classmethod
+            if i == 0 and (name == "self" or is_classmethod):
                 continue
 
-            for i, argument in get_unused_arguments(function):
-                name = argument.arg
-                if self.ignore_variadic_names:
-                    if function.args.vararg and function.args.vararg.arg == name:
-                        continue
-                    if function.args.kwarg and function.args.kwarg.arg == name:
-                        continue
-
-                # ignore self or whatever the first argument is for a classmethod
-                if i == 0 and (name == "self" or "classmethod" in decorator_names):
-                    continue
-
-                line_number = argument.lineno
-                offset = argument.col_offset
-
-                if name.startswith("_"):
-                    error_code = "U101"
-                else:
-                    error_code = "U100"
-
-                text = "{error_code} Unused argument '{name}'".format(
-                    error_code=error_code, name=name
-                )
-                check = "unused argument"
-                yield (line_number, offset, text, check)
-
-
-def get_unused_arguments(function: FunctionTypes) -> List[Tuple[int, ast.arg]]:
-    """Generator that yields all of the unused arguments in the given function."""
-    arguments = list(enumerate(get_arguments(function)))
-
-    class NameFinder(NodeVisitor):
-        def visit_Name(self, name: ast.Name) -> None:
-            nonlocal arguments
-            if isinstance(name.ctx, Store):
-                return
-
-            arguments = [
-                (arg_index, arg) for arg_index, arg in arguments if arg.arg != name.id
-            ]
-
-    NameFinder().visit(function)
+            line_number = argument.lineno
+            offset = argument.col_offset
 
-    return arguments
-
-
-def get_arguments(function: FunctionTypes) -> List[ast.arg]:
-    """Get all of the argument names of the given function."""
-    args = function.args
-
-    ordered_arguments: List[ast.arg] = []
-
-    # plain old args
-    ordered_arguments.extend(args.args)
-
-    # *arg name
-    if args.vararg is not None:
-        ordered_arguments.append(args.vararg)
-
-    # *, key, word, only, args
-    ordered_arguments.extend(args.kwonlyargs)
-
-    # **kwarg name
-    if args.kwarg is not None:
-        ordered_arguments.append(args.kwarg)
-
-    return ordered_arguments
-
-
-def get_decorator_names(function: FunctionTypes) -> Iterable[str]:
-    if isinstance(function, ast.Lambda):
-        return
-
-    for decorator in function.decorator_list:
-        if isinstance(decorator, ast.Name):
-            yield decorator.id
-        elif isinstance(decorator, ast.Attribute):
-            yield decorator.attr
-        elif isinstance(decorator, ast.Call):
-            if isinstance(decorator.func, ast.Name):
-                yield decorator.func.id
+            if name.startswith("_"):
+                error_code = UNUSED_UNDERSCORE_ARGUMENT
             else:
-                yield decorator.func.attr  # type: ignore
-        else:
-            assert False, decorator
-
-
-def is_stub_function(function: FunctionTypes) -> bool:
-    if isinstance(function, ast.Lambda):
-        return isinstance(function.body, ast.Constant) and function.body.value is ...
-
-    statement = function.body[0]
-    if (
-        isinstance(statement, ast.Expr)
-        and isinstance(statement.value, ast.Constant)
-        and isinstance(statement.value.value, str)
-    ):
-        if len(function.body) > 1:
-            # first statement is a docstring, let's skip it
-            statement = function.body[1]
-        else:
-            # it's a function with only a docstring, that's a stub
-            return True
-
-    if isinstance(statement, ast.Pass):
-        return True
-    if (
-        isinstance(statement, ast.Expr)
-        and isinstance(statement.value, ast.Constant)
-        and statement.value.value is ...
-    ):
-        return True
-
-    if isinstance(statement, ast.Raise):
-        # raise NotImplementedError()
-        if (
-            isinstance(statement.exc, ast.Call)
-            and hasattr(statement.exc.func, "id")
-            and statement.exc.func.id == "NotImplementedError"
-        ):
-            return True
-
-        # raise NotImplementedError
-        elif (
-            isinstance(statement.exc, ast.Name)
-            and hasattr(statement.exc, "id")
-            and statement.exc.id == "NotImplementedError"
-        ):
-            return True
-
-    return False
-
-
-def is_dunder_method(function: FunctionTypes) -> bool:
-    if isinstance(function, ast.Lambda):
-        return False
+                error_code = UNUSED_ARGUMENT
 
-    if not hasattr(function, "name"):
-        return False
-
-    name = function.name
-    return len(name) > 4 and name.startswith("__") and name.endswith("__")
-
-
-class FunctionFinder(NodeVisitor):
-    functions: List[FunctionTypes]
-
-    def __init__(self, only_top_level: bool = False) -> None:
-        super().__init__()
-        self.functions = []
-        self.only_top_level = only_top_level
-
-    def visit_function_types(self, function: FunctionTypes) -> None:
-        self.functions.append(function)
-        if self.only_top_level:
-            return
-        if isinstance(function, ast.Lambda):
-            self.visit(function.body)
-        else:
-            for obj in function.body:
-                self.visit(obj)
+            text = f"{error_code} Unused argument '{name}'"
+            add_result((line_number, offset, text, CHECK))
 
-    visit_AsyncFunctionDef = visit_FunctionDef = visit_Lambda = visit_function_types  # type: ignore[assignment]
+        return results
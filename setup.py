@@ -1,9 +1,25 @@
+import os
+
 from setuptools import setup
 
 requires = [
     "flake8 > 3.0.0",
 ]
 
+# Optionally compile the plugin's helpers with mypyc. The pure Python module is
+# still shipped, and is used wherever the compiled extension isn't available.
+# flake8_unused_arguments itself isn't compiled, as flake8 inspects Plugin's
+# signature, which compiled classes don't expose. mypyc must be importable
+# here, so build with pip's --no-build-isolation.
+if os.environ.get("FLAKE8_UNUSED_ARGUMENTS_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        ["--ignore-missing-imports", "_flake8_unused_arguments.py"]
+    )
+else:
+    ext_modules = []
+
 setup(
     name="flake8-unused-arguments",
     license="MIT",
@@ -11,7 +27,8 @@ setup(
     description="flake8 extension to warn on unused function arguments",
     author="Nathan Hoad",
     author_email="nathan@hoad.io",
-    py_modules=["flake8_unused_arguments"],
+    py_modules=["flake8_unused_arguments", "_flake8_unused_arguments"],
+    ext_modules=ext_modules,
     url="https://github.com/nhoad/flake8-unused-arguments",
     long_description=open("README.md").read(),
     long_description_content_type="text/markdown",
@@ -1,7 +1,10 @@
 import ast
+import os
 import re
 import subprocess
+import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from unittest.mock import patch
 
@@ -53,6 +56,7 @@ def test_get_argument_names(function, expected_names):
     "function, expected_names",
     [
         ("def foo(a, b, c): return a + b", ["c"]),
+        ("def foo(a, b): return a + b + a + b", []),
         (
             """
         class foo:
@@ -95,6 +99,7 @@ def test_get_unused_arguments(function, expected_names):
     """,
             ["a", "b", "c", "d"],
         ),
+        ("@handlers[0]\n@a\ndef foo(): pass", ["a"]),
         ("lambda g: 5", []),
     ],
 )
@@ -105,6 +110,24 @@ def test_get_decorator_names(function, expected_result):
     assert function_names == expected_result
 
 
+@pytest.mark.parametrize(
+    "function, expected_result",
+    [
+        ("def foo(): pass", 0),
+        ("@abstractmethod\ndef foo(): pass", 1),
+        ("@typing.overload\ndef foo(): pass", 2),
+        ("@override\ndef foo(): pass", 4),
+        ("@classmethod\n@abc.abstractmethod\ndef foo(): pass", 9),
+        ("@cache\ndef foo(): pass", 0),
+        ("lambda g: 5", 0),
+    ],
+)
+def test_classify_decorators(function, expected_result):
+    from flake8_unused_arguments import classify_decorators
+
+    assert classify_decorators(get_function(function)) == expected_result
+
+
 @pytest.mark.parametrize(
     "function, expected_result",
     [
@@ -112,6 +135,8 @@ def test_get_decorator_names(function, expected_result):
         ("def foo():\n 'with docstring'", True),
         ("def foo():\n 'with docstring'\n ...", True),
         ("def foo():\n 'with docstring'\n return 5", False),
+        ("def foo():\n 'with docstring'\n pass\n return 5", False),
+        ("def foo():\n pass\n return 5", False),
         ("def foo():\n 'string' + 'with docstring'\n ...", False),
         ("def foo():\n f = 'string' + 'with docstring'\n ...", False),
         ("def foo(): pass", True),
@@ -420,6 +445,62 @@ def test_integration(function, options, expected_warnings):
         assert warnings == expected_warnings
 
 
+def test_integration_parallel():
+    from flake8_unused_arguments import (
+        PARALLEL_MAX_WORKERS,
+        PARALLEL_THRESHOLD,
+        Plugin,
+    )
+
+    code = "".join(
+        f"def foo_{i}(a, b):\n    return b\n" for i in range(PARALLEL_THRESHOLD + 1)
+    )
+    expected_warnings = [
+        (i * 2 + 1, 9 + len(str(i)), "U100 Unused argument 'a'", "unused argument")
+        for i in range(PARALLEL_THRESHOLD + 1)
+    ]
+
+    with patch.dict("os.environ", {"FLAKE8_UNUSED_ARGUMENTS_PARALLEL": "1"}), patch(
+        "flake8_unused_arguments.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as executor:
+        warnings = list(Plugin(ast.parse(code)).run())
+
+    # the functions really were checked by the pool, and kept their order
+    executor.assert_called_once_with(
+        max_workers=min(PARALLEL_MAX_WORKERS, os.cpu_count() or 1)
+    )
+    assert warnings == expected_warnings
+
+
+def test_plugin_parameters():
+    from flake8.plugins.finder import _parameters_for
+
+    from flake8_unused_arguments import Plugin
+
+    # flake8 works out what to pass to the plugin from its signature
+    assert _parameters_for(Plugin) == {"tree": True}
+
+
+def test_flake8_end_to_end(tmp_path):
+    def run_flake8(*args):
+        # run from the temporary directory, so flake8 loads the installed plugin
+        return subprocess.run(
+            [sys.executable, "-m", "flake8", *args],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+
+    if "flake8-unused-arguments" not in run_flake8("--version").stdout:
+        pytest.skip("flake8-unused-arguments isn't installed")
+
+    (tmp_path / "example.py").write_text("def foo(a, b):\n    return b\n")
+    result = run_flake8("--select", "U", "example.py")
+
+    assert result.stderr == ""
+    assert result.stdout == "example.py:1:9: U100 Unused argument 'a'\n"
+
+
 @pytest.mark.release
 def test_check_version() -> None:
     from flake8_unused_arguments import Plugin
@@ -464,6 +545,23 @@ def test_function_finder(only_top_level, expected):
     assert names == expected
 
 
+def test_function_finder_used_names():
+    from flake8_unused_arguments import FunctionFinder
+
+    finder = FunctionFinder()
+    finder.visit(ast.parse(FF_CODE))
+    used_names = {
+        node.name: finder.used_names[node] for node in finder.functions
+    }
+
+    assert used_names == {
+        "some_function": {"a", "b", "some_nested_function"},
+        "some_nested_function": {"b"},
+        "some_method": {"a", "b", "some_nested_method"},
+        "some_nested_method": {"b"},
+    }
+
+
 @pytest.mark.parametrize(
     "code, expected_value",
     [